@@ -29,43 +29,43 @@ downloads the missing BibTeX records to a separate BibTeX file for each of the
 bibliographies, and automatically adds them as references or as part of a bibliography
 in LaTeX. Tested with Python 3.11. '''
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from html.parser import HTMLParser
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
 import urllib.request as req
+import http.client
+import threading
+import gzip
+import zlib
 import os
 import os.path
 import re
+import sys
 import argparse
 import configparser
 import calendar
+import sqlite3
+import time
 
 ARXIV_ID_RE = re.compile(r'arXiv:((\d\d)(\d\d)\.\d+)')
+BIBTEX_CITATION_RE = re.compile(rb'@[a-zA-Z]+\s*\{([^,\n]*),')
+TEX_CITATION_RE = re.compile(r'(?:cite|citep|citet|fullciteown|autocite|textcite)\{([^}\n]+)}')
+# [^@] keeps every match attempt within one record, so backtracking is bounded by its length
+BIBTEX_ITEMS_RE = re.compile(rb'(@[a-zA-Z]+\{([^,@]+),[^@]*\n})')
+MAX_FETCH_WORKERS = 16  # concurrent downloads
+MAX_REDIRECTS = 5  # redirects followed per download
+CACHE_FILE = '.get_bibtex_cache.sqlite'  # downloaded BibTeX records, reused across runs
+CACHE_EXPIRY = 7 * 24 * 60 * 60  # seconds before a cached download is fetched again
 TEX_FILES_DIRECTORY = './'  # (sub)directory containing the .tex files
 ignore_tex_files = set()  # files within the directory that should be ignored
+ignore_directories = {'.git', '.svn', '.hg', 'node_modules', '__pycache__'}  # subdirectories that are not searched
 
 known_keys = set([])
 unused_keys = set([])
 
-arxiv_keys = set([])
-fetched_arxiv_keys = set([])
-
-base_keys = set([])
-fetched_base_keys = set([])
-
-cogprints_keys = set([])
-fetched_cogprints_keys = set([])
-
-dblp_keys = set([])
-fetched_dblp_keys = set([])
-
-jstor_keys = set([])
-fetched_jstor_keys = set([])
-
-microsoft_keys = set([])
-fetched_microsoft_keys = set([])
-
-springer_keys = set([])
-fetched_springer_keys = set([])
+connections = threading.local()  # open HTTP connections of each download thread, by host
 
 class BibItem():
     """Represents BibTeX items"""
@@ -215,118 +215,122 @@ class MyHTMLParser(HTMLParser):
             if self.stack and self.stack[-1]['class'] == char:
                 self.tmp[char] = self.tmp.get(char, '') + data
 
-def return_bibtex():
-    """Compiles and returns the BibTeX file citations"""
-    re_bibtex_citations = re.compile(r'@.*\{([^,]*),')
-    return re_bibtex_citations
+class Bibliography():
+    """Represents an online bibliography, its BibTeX file and its citation keys"""
+    def __init__(self, name, prefix, option, url, bibtex_file, style):
+        assert style in ('html', 'same_key', 'crossref')
+        self.name = name
+        self.prefix = prefix
+        self.option = option
+        self.url = url
+        self.bibtex_file = bibtex_file
+        self.style = style
+        self.keys = set()
+        self.fetched_keys = set()
+
+    def get_url(self, key):
+        """Returns the URL of the BibTeX record for the citation key"""
+        return self.url.format(key[len(self.prefix) + 1:])
+
+    def write(self, unknown_key, content):
+        """Writes the downloaded BibTeX record to the BibTeX file"""
+        if self.style == 'html':
+            parser = MyHTMLParser()
+            parser.feed(content.decode('utf-8'))
+            open_bibtex_file_parser(self.bibtex_file, parser)
+        elif self.style == 'same_key':
+            open_bibtex_file_same_key(self.bibtex_file, content, self.fetched_keys, self.name)
+        else:
+            open_bibtex_file_diff_key(self.bibtex_file, content, self.fetched_keys, unknown_key, self.name)
+
+bibliographies = [
+    Bibliography('arXiv', 'Arxiv', 'a', 'https://arxiv.org/abs/{}',
+                 'arxiv.bib', 'html'),
+    Bibliography('BASE', 'BASE', 'b', 'https://www.base-search.net/Record/{}/Export?style[]=BibTeX',
+                 'base.bib', 'crossref'),
+    Bibliography('Cogprints', 'Cogprints', 'c', 'https://web-archive.southampton.ac.uk/cogprints.org/cgi/export/eprint/{}.bib.html',
+                 'cogprints.bib', 'crossref'),
+    Bibliography('DBLP', 'DBLP', 'd', 'https://dblp.org/rec/{}.bib',
+                 'dblp.bib', 'same_key'),
+    Bibliography('JSTOR', 'JSTOR', 'j', 'https://www.jstor.org/citation/text/{}',
+                 'jstor.bib', 'crossref'),
+    Bibliography('Microsoft Research', 'Microsoft', 'm', 'https://www.microsoft.com/en-us/research/publication/{}/bibtex/',
+                 'microsoft.bib', 'crossref'),
+    Bibliography('SpringerLink', 'Springer', 's', 'https://citation-needed.springer.com/v2/references/10.1007/{}',
+                 'springer.bib', 'crossref'),
+]
+
+prefix_keys = {bibliography.prefix: bibliography.keys for bibliography in bibliographies}
 
 def read_existing_file(name_bibtex_file):
     """Reads the existing BibTeX file or create a new one if it is not found"""
     if os.path.isfile(name_bibtex_file):
         print(f'\nReading existing BibTeX file {name_bibtex_file}')
-        with (open(name_bibtex_file, encoding="utf-8")) as file:
-            for _, line in enumerate(file):
-                for match in re.finditer(return_bibtex(), line):
-                    for key in match.groups():
-                        known_keys.add(key)
+        with open(name_bibtex_file, 'rb') as file:
+            text = file.read()
+        known_keys.update(match.group(1).decode('utf-8') for match in BIBTEX_CITATION_RE.finditer(text))
 
     else:
         print(f'\nBibTeX file {name_bibtex_file} not found, will try to create it.')
 
-def read_all_existing_files():
+def print_keys(keys):
+    """Prints the keys one per line with a single write"""
+    if keys:
+        sys.stdout.write('\n'.join(keys) + '\n')
+
+def read_all_existing_files(verbose=False):
     """Compiles and reads all of the existing bibliography BibTex files"""
-    read_existing_file(arxiv_bibtex_file)
-    read_existing_file(base_bibtex_file)
-    read_existing_file(cogprints_bibtex_file)
-    read_existing_file(dblp_bibtex_file)
-    read_existing_file(jstor_bibtex_file)
-    read_existing_file(microsoft_bibtex_file)
-    read_existing_file(springer_bibtex_file)
-
-    print('\nThe following {name} keys have been found in your BibTeX files:')
-    for key in known_keys:
-        print (f'{key}')
-
-def return_tex_citation():
-    """Compiles and returns the LateX citations"""
-    re_tex_citation = re.compile(r'(?:cite|citep|citet|fullciteown|autocite|textcite)\{([^}]+)}')
-    return re_tex_citation
+    for bibliography in bibliographies:
+        read_existing_file(bibliography.bibtex_file)
+
+    if verbose:
+        print('\nThe following keys have been found in your BibTeX files:')
+        print_keys(known_keys)
 
 def find_keys(name, name_keys):
     """Finds the bibliography keys in the LaTeX files"""
     print(f'\nThe following {name} keys have been found in your LaTeX files:')
-    for key in name_keys:
-        print (f'{key}')
+    print_keys(name_keys)
 
 def find_all_keys():
     """Calls on the previous functions of finding the keys of all the bibliographies"""
-    find_keys('arXiv', arxiv_keys)
-    find_keys('BASE', base_keys)
-    find_keys('Cogprints', cogprints_keys)
-    find_keys('DBLP', dblp_keys)
-    find_keys('JSTOR', jstor_keys)
-    find_keys('Microsoft Research', microsoft_keys)
-    find_keys('SpringerLink', springer_keys)
+    for bibliography in bibliographies:
+        find_keys(bibliography.name, bibliography.keys)
     find_keys('unused', unused_keys)
 
-def read_latex():
+def read_latex(verbose=False):
     """Reads the LateX documents and adds the corresponding keys"""
     print('\nReading your LaTeX documents:')
 
-    return_tex_citation()
-
     for dirpath, dirnames, filenames in os.walk(TEX_FILES_DIRECTORY):
-        exclude = set([])
-        list(set(dirnames) - exclude)
+        dirnames[:] = [d for d in dirnames if d not in ignore_directories]
 
         for filename in [f for f in filenames if f.endswith('.tex') and
                          f not in ignore_tex_files]:
             print (f'{filename}')
-            with open(Path(dirpath) / filename, encoding="utf-8") as file:
-                for _, line in enumerate(file):
-                    for match in re.finditer(return_tex_citation(), line):
-                        for group in match.groups():
-                            for key in group.split(','):
-                                if key.strip().startswith('Arxiv:'):
-                                    arxiv_keys.add(key.strip())
-                                elif key.strip().startswith('BASE:'):
-                                    base_keys.add(key.strip())
-                                elif key.strip().startswith('Cogprints:'):
-                                    cogprints_keys.add(key.strip())
-                                elif key.strip().startswith('DBLP:'):
-                                    dblp_keys.add(key.strip())
-                                elif key.strip().startswith('JSTOR:'):
-                                    jstor_keys.add(key.strip())
-                                elif key.strip().startswith('Microsoft:'):
-                                    microsoft_keys.add(key.strip())
-                                elif key.strip().startswith('Springer:'):
-                                    springer_keys.add(key.strip())
-                                else:
-                                    unused_keys.add(key.strip())
-
-    find_all_keys()
-
-def compile_bibtex_items():
-    """Compiles the BibTeX items"""
-    re_bibtex_items = re.compile(r'(@[a-zA-Z]+\{[^@]*\n})', re.DOTALL)
-    return re_bibtex_items
-
-def compile_bibtex_item_key():
-    """Compiles the BibTeX item key"""
-    re_bibtex_item_key = re.compile(r'@[a-zA-Z]+\{([^,]+),\s*', re.DOTALL)
-    return re_bibtex_item_key
+            with open(os.path.join(dirpath, filename), encoding="utf-8") as file:
+                text = file.read()
+            file_keys = {}
+            for match in TEX_CITATION_RE.finditer(text):
+                for key in match.group(1).split(','):
+                    key = sys.intern(key.strip())
+                    prefix, sep, _ = key.partition(':')
+                    file_keys.setdefault(prefix if sep else '', []).append(key)
+            for prefix, keys in file_keys.items():
+                prefix_keys.get(prefix, unused_keys).update(keys)
+
+    if verbose:
+        find_all_keys()
 
 def find_missing_keys(name):
     """Finds the missing keys from the bibliography"""
     print(f'\nFetching BibTeX records for missing keys from {name}:')
-    compile_bibtex_items()
-    compile_bibtex_item_key()
 
 def check_missing_keys(name_bibtex_file, name_keys, name):
     """Checks for missing keys in the BibTeX file"""
-    if not os.path.isfile(name_bibtex_file) and name_keys == set():
+    if not os.path.isfile(name_bibtex_file) and not name_keys:
         print (f'\nYou do not have a {name} BibTeX file, nothing needs to be fetched. :-)')
-    elif name_keys == set():
+    elif not name_keys:
         print(f'\nYour {name} BibTeX file is up to date, nothing needs to be fetched. :-)')
     else:
         find_missing_keys(name)
@@ -335,32 +339,31 @@ def check_missing_keys(name_bibtex_file, name_keys, name):
 def open_bibtex_file_same_key(name_bibtex_file, name_bibtex_file_content, fetched_name_keys, name):
     """Opens the BibTeX file for the bibliography with the same LaTeX citation key and
     writes it to our BibTeX file if it is not already there"""
-    with open(name_bibtex_file, 'a', encoding="utf8") as file:
-        for match in re.finditer(compile_bibtex_items(), name_bibtex_file_content):
-            for bibtex_item in match.groups():
-                key = re.match(compile_bibtex_item_key(), bibtex_item).group(1)
-                if key not in fetched_name_keys | known_keys:
-                    file.write(bibtex_item)
-                    file.write('\n\n')
-                    fetched_name_keys.add(key)
-                else:
-                    print(f'(not adding {key} to {name} BibTeX file, it is already there.)')
+    new_bibtex_items = []
+    for match in BIBTEX_ITEMS_RE.finditer(name_bibtex_file_content):
+        bibtex_item, key = match.group(1), match.group(2).decode('utf-8')
+        if key not in fetched_name_keys and key not in known_keys:
+            new_bibtex_items.append(bibtex_item + b'\n\n')
+            fetched_name_keys.add(key)
+        else:
+            print(f'(not adding {key} to {name} BibTeX file, it is already there.)')
+    with open(name_bibtex_file, 'ab') as file:
+        file.write(b''.join(new_bibtex_items))
 
 def open_bibtex_file_diff_key(name_bibtex_file, name_bibtex_file_content, fetched_name_keys, unknown_name_key, name):
     """Opens the BibTeX file for the bibliography with the different LaTeX citation key and
     writes it to our BibTeX file if it is not already there"""
-    with open(name_bibtex_file, 'a', encoding="utf8") as file:
-        for match in re.finditer(compile_bibtex_items(), name_bibtex_file_content):
-            for bibtex_item in match.groups():
-                key = re.match(compile_bibtex_item_key(), bibtex_item).group(1)
-                if key not in fetched_name_keys | known_keys:
-                    file.write(f'@article{{{unknown_name_key}, crossref = {{{key}}}}}')
-                    file.write('\n\n')
-                    file.write(bibtex_item)
-                    file.write('\n\n')
-                    fetched_name_keys.add(key)
-                else:
-                    print(f'(not adding {key} to {name} BibTeX file, it is already there.)')
+    new_bibtex_items = []
+    for match in BIBTEX_ITEMS_RE.finditer(name_bibtex_file_content):
+        bibtex_item, key = match.group(1), match.group(2).decode('utf-8')
+        if key not in fetched_name_keys and key not in known_keys:
+            new_bibtex_items.append(f'@article{{{unknown_name_key}, crossref = {{{key}}}}}\n\n'.encode('utf-8'))
+            new_bibtex_items.append(bibtex_item + b'\n\n')
+            fetched_name_keys.add(key)
+        else:
+            print(f'(not adding {key} to {name} BibTeX file, it is already there.)')
+    with open(name_bibtex_file, 'ab') as file:
+        file.write(b''.join(new_bibtex_items))
 
 def open_bibtex_file_parser(name_bibtex_file, name_bibtex_file_content):
     """Opens the BibTeX file for the bibliography that uses HTML Parser and
@@ -373,123 +376,117 @@ def open_bibtex_file_parser(name_bibtex_file, name_bibtex_file_content):
         file.writelines(lines)
     name_bibtex_file_content.close()
 
-def open_arxiv_url():
-    """Opens arXiv BibTeX file from its website"""
-    for unknown_arxiv_key in check_missing_keys(arxiv_bibtex_file, arxiv_keys, 'arXiv', ):
-        print (f'{unknown_arxiv_key}')
-
-        arxiv_url = f'https://arxiv.org/abs/{unknown_arxiv_key[6:]}'
-
-        with req.urlopen(arxiv_url) as res:
-            arxiv_bibtex_file_content = MyHTMLParser()
-            arxiv_bibtex_file_content.feed(res.read().decode('utf-8'))
-            res.close()
-
-            open_bibtex_file_parser(arxiv_bibtex_file, arxiv_bibtex_file_content)
-
-def open_base_url():
-    """Opens BASE BibTeX file from its website"""
-    for unknown_base_key in check_missing_keys(base_bibtex_file, base_keys, 'BASE'):
-        print (f'{unknown_base_key}')
-
-        base_url = f'https://www.base-search.net/Record/{unknown_base_key[5:]}/Export?style[]=BibTeX'
-
-        with req.urlopen(base_url) as res:
-            base_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_diff_key(base_bibtex_file, base_bibtex_file_content, fetched_base_keys, unknown_base_key,'BASE')
-
-def open_cogprints_url():
-    """Opens Cogprints BibTeX file from its website"""
-    for unknown_cogprints_key in check_missing_keys(cogprints_bibtex_file, cogprints_keys, 'Cogprints'):
-        print (f'{unknown_cogprints_key}')
-
-        cogprints_url = f'https://web-archive.southampton.ac.uk/cogprints.org/cgi/export/eprint/{unknown_cogprints_key[10:]}.bib.html'
-
-        with req.urlopen(cogprints_url) as res:
-            cogprints_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_diff_key(cogprints_bibtex_file, cogprints_bibtex_file_content, fetched_cogprints_keys, unknown_cogprints_key, 'Cogprints')
-
-def open_dblp_url():
-    """Opens DBLP BibTeX file from its website"""
-    for unknown_dblp_key in check_missing_keys(dblp_bibtex_file, dblp_keys, 'DBLP'):
-        print (f'{unknown_dblp_key}')
-
-        dblp_url = f'https://dblp.org/rec/{unknown_dblp_key[5:]}.bib'
-
-        with req.urlopen(dblp_url) as res:
-            dblp_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_same_key(dblp_bibtex_file, dblp_bibtex_file_content, fetched_dblp_keys, 'DBLP')
-
-def open_jstor_url():
-    """Opens JSTOR BibTeX file from its website"""
-    for unknown_jstor_key in check_missing_keys(jstor_bibtex_file, jstor_keys, 'JSTOR'):
-        print (f'{unknown_jstor_key}')
-
-        jstor_url = f'https://www.jstor.org/citation/text/{unknown_jstor_key[6:]}'
-
-        with req.urlopen(jstor_url) as res:
-            jstor_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_diff_key(jstor_bibtex_file, jstor_bibtex_file_content, fetched_jstor_keys, unknown_jstor_key, 'JSTOR')
-
-def open_microsoft_url():
-    """Opens Microsoft Research BibTeX file from its website"""
-    for unknown_microsoft_key in check_missing_keys(microsoft_bibtex_file, microsoft_keys, 'Microsoft Research'):
-        print (f'{unknown_microsoft_key}')
-
-        microsoft_url = f'https://www.microsoft.com/en-us/research/publication/{unknown_microsoft_key[10:]}/bibtex/'
-
-        with req.urlopen(microsoft_url) as res:
-            microsoft_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_diff_key(microsoft_bibtex_file, microsoft_bibtex_file_content, fetched_microsoft_keys, unknown_microsoft_key, 'Microsoft Research')
-
-def open_springer_url():
-    """Opens SpringerLink BibTeX file from its website"""
-    for unknown_springer_key in check_missing_keys(springer_bibtex_file, springer_keys, 'SpringerLink'):
-        print (f'{unknown_springer_key}')
-
-        springer_url = f'https://citation-needed.springer.com/v2/references/10.1007/{unknown_springer_key[9:]}'
-
-        with req.urlopen(springer_url) as res:
-            springer_bibtex_file_content = res.read().decode('utf-8')
-            open_bibtex_file_diff_key(springer_bibtex_file, springer_bibtex_file_content, fetched_springer_keys, unknown_springer_key, 'SpringerLink')
+def fetch_url(url, redirects=MAX_REDIRECTS):
+    """Downloads and returns the undecoded contents of the URL, keeping the connection
+    to its host open for the next download of the same thread"""
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or parts.scheme in req.getproxies():
+        with req.urlopen(url) as res:
+            return res.read()
+
+    if not hasattr(connections, 'hosts'):
+        connections.hosts = {}
+    host = (parts.scheme, parts.netloc)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    headers = {'User-Agent': f'Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}',
+               'Accept-Encoding': 'gzip'}
+
+    # retry once on a fresh connection in case the server closed the kept-alive one
+    for attempt in range(2):
+        if host not in connections.hosts:
+            connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            connections.hosts[host] = connection_class(parts.netloc)
+        connection = connections.hosts[host]
+        try:
+            connection.request('GET', path, headers=headers)
+            res = connection.getresponse()
+            content = res.read()
+            break
+        except (http.client.HTTPException, OSError):
+            connections.hosts.pop(host).close()
+            if attempt:
+                raise
+
+    if res.status in (301, 302, 303, 307, 308) and res.getheader('Location') and redirects:
+        redirect_url = urljoin(url, res.getheader('Location'))
+        if urlsplit(redirect_url).scheme not in ('http', 'https'):
+            raise HTTPError(url, res.status, f'Redirection to url {redirect_url!r} is not allowed', res.headers, None)
+        return fetch_url(redirect_url, redirects - 1)
+    if res.status >= 300:
+        raise HTTPError(url, res.status, res.reason, res.headers, None)
+    if res.getheader('Content-Encoding') == 'gzip':
+        try:
+            content = gzip.decompress(content)
+        except (EOFError, zlib.error) as error:
+            raise http.client.HTTPException(f'invalid gzip response from {url}: {error}') from error
+    return content
+
+def try_fetch_url(url):
+    """Downloads the URL like fetch_url, but returns the error instead of raising it"""
+    try:
+        return fetch_url(url)
+    except (OSError, http.client.HTTPException, ValueError) as error:
+        return error
+
+def fetch_all_urls(urls):
+    """Downloads the URLs that are not cached concurrently and returns their contents
+    in the same order, or the error for each URL that could not be downloaded"""
+    if not urls:
+        return []
+
+    now = time.time()
+    with closing(sqlite3.connect(CACHE_FILE)) as cache:
+        with cache:
+            cache.execute('CREATE TABLE IF NOT EXISTS downloads (url TEXT PRIMARY KEY, time REAL, content BLOB)')
+            cache.execute('DELETE FROM downloads WHERE time <= ?', (now - CACHE_EXPIRY,))
+        contents = {}
+        for url in dict.fromkeys(urls):
+            row = cache.execute('SELECT content FROM downloads WHERE url = ?', (url,)).fetchone()
+            if row:
+                contents[url] = row[0]
+        missing_urls = [url for url in dict.fromkeys(urls) if url not in contents]
+
+        # each download is committed as soon as it arrives, so an interrupted run keeps them
+        with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+            futures = {executor.submit(try_fetch_url, url): url for url in missing_urls}
+            for future in as_completed(futures):
+                url, content = futures[future], future.result()
+                if not isinstance(content, Exception):
+                    with cache:
+                        cache.execute('INSERT OR REPLACE INTO downloads VALUES (?, ?, ?)', (url, now, content))
+                contents[url] = content
+    return [contents[url] for url in urls]
 
 def open_url():
-    """Calls on the previous functions of opening the BibTeX files from their website"""
-    open_arxiv_url()
-    open_base_url()
-    open_cogprints_url()
-    open_dblp_url()
-    open_jstor_url()
-    open_microsoft_url()
-    open_springer_url()
-
-if __name__ == '__main__':
-    try:
-        proxy = {'http': os.environ['http_proxy']}
-    except KeyError as e:
-        proxy = {}
-    handler = req.ProxyHandler(proxy)
-    opener = req.build_opener(handler)
+    """Downloads the BibTeX records of all the bibliographies concurrently and writes
+    them to their BibTeX files one after another"""
+    unknown_keys = {bibliography: bibliography.keys - known_keys for bibliography in bibliographies}
+    urls = [(bibliography, key) for bibliography in bibliographies for key in unknown_keys[bibliography]]
+    contents = fetch_all_urls([bibliography.get_url(key) for bibliography, key in urls])
+    contents = dict(zip(urls, contents))
+
+    for bibliography in bibliographies:
+        for unknown_key in check_missing_keys(bibliography.bibtex_file, unknown_keys[bibliography], bibliography.name):
+            print (f'{unknown_key}')
+            content = contents[bibliography, unknown_key]
+            if isinstance(content, Exception):
+                print(f'(could not fetch {unknown_key}, skipping it: {content})')
+            else:
+                bibliography.write(unknown_key, content)
 
+def main():
+    """Parses the command line arguments, then reads the existing BibTeX files and LaTeX
+    documents and fetches the missing BibTeX records"""
     arg_parser = argparse.ArgumentParser(description='Create BibTeX input and output files.')
     arg_parser.add_argument('--config',                         help='Configuration file; file header always starts with "[Defaults]".')
-    arg_parser.add_argument('--a',     default='arxiv.bib',     help='ArXiv BibTeX input and output file.')
-    arg_parser.add_argument('--b',     default='base.bib',      help='BASE BibTeX input and output file.')
-    arg_parser.add_argument('--c',     default='cogprints.bib', help='Cogprints BibTeX input and output file.')
-    arg_parser.add_argument('--d',     default='dblp.bib',      help='DBLP BibTeX input and output file.')
-    arg_parser.add_argument('--j',     default='jstor.bib',     help='JSTOR BibTeX input and output file.')
-    arg_parser.add_argument('--m',     default='microsoft.bib', help='Microsoft Research BibTeX input and output file.')
-    arg_parser.add_argument('--s',     default='springer.bib',  help='SpringerLink BibTeX input and output file.')
+    for bibliography in bibliographies:
+        arg_parser.add_argument(f'--{bibliography.option}', default=bibliography.bibtex_file,
+                                help=f'{bibliography.name} BibTeX input and output file.')
+    arg_parser.add_argument('--verbose', action='store_true',   help='List the keys found in the BibTeX and LaTeX files.')
     args = arg_parser.parse_args()
 
-    arxiv_bibtex_file = args.a
-    base_bibtex_file = args.b
-    cogprints_bibtex_file = args.c
-    dblp_bibtex_file = args.d
-    jstor_bibtex_file = args.j
-    microsoft_bibtex_file = args.m
-    springer_bibtex_file = args.s
-
     if args.config:
         config = configparser.ConfigParser()
         config.read(args.config)
@@ -498,16 +495,14 @@ if __name__ == '__main__':
         arg_parser.set_defaults(**defaults)
         args = arg_parser.parse_args()
 
-        arxiv_bibtex_file = args.a
-        base_bibtex_file = args.b
-        cogprints_bibtex_file = args.c
-        dblp_bibtex_file = args.d
-        jstor_bibtex_file = args.j
-        microsoft_bibtex_file = args.m
-        springer_bibtex_file = args.s
+    for bibliography in bibliographies:
+        bibliography.bibtex_file = getattr(args, bibliography.option)
 
-    read_all_existing_files()
-    read_latex()
+    read_all_existing_files(args.verbose)
+    read_latex(args.verbose)
     open_url()
 
     print('\nAll done. :-)')
+
+if __name__ == '__main__':
+    main()